@@ -0,0 +1,218 @@
+"""
+Запуск и остановка приложения: бот, мониторинг цен и проверки состояния.
+"""
+from typing import Any, Awaitable, Callable, Dict, Tuple
+import asyncio
+import signal
+from loguru import logger
+
+from config import Settings
+from .health import HealthServer, StartupMetrics
+from .resources import Resources
+from .supervisor import Supervisor
+
+
+class Application:
+    """
+    Приложение бота.
+
+    Бот начинает получать обновления сразу после запуска, а база данных,
+    Redis и браузеры инициализируются при первом использовании.
+    """
+
+    def __init__(self, config: Settings, metrics: StartupMetrics):
+        """
+        Инициализация приложения.
+
+        Args:
+            config: Настройки приложения
+            metrics: Метрики запуска процесса
+        """
+        self.config = config
+        self.metrics = metrics
+        self.resources = Resources(config)
+        self.supervisor = Supervisor()
+        self.health = HealthServer(
+            config.HEALTH_HOST,
+            config.HEALTH_PORT,
+            ready=self.is_ready,
+            report=self.report
+        )
+        self._stop_event = asyncio.Event()
+        self._started: bool = False
+        # Последняя цена, о которой уведомили, по товару и магазину
+        self._notified: Dict[Tuple[int, str], float] = {}
+        self.bot = None
+        self.dispatcher = None
+
+    def is_ready(self) -> bool:
+        """Готовность приложения к обработке обновлений."""
+        return (
+            self._started
+            and not self._stop_event.is_set()
+            and all(self.supervisor.status().values())
+        )
+
+    def report(self) -> Dict[str, Any]:
+        """Подробное состояние приложения для проверки готовности."""
+        return {
+            "services": self.supervisor.status(),
+            "resources": self.resources.status(),
+            "startup": self.metrics.as_dict(),
+        }
+
+    def request_shutdown(self) -> None:
+        """Запрос на остановку приложения."""
+        if not self._stop_event.is_set():
+            logger.info("Получен сигнал остановки")
+            self._stop_event.set()
+
+    async def run(self) -> None:
+        """Запуск приложения и ожидание сигнала остановки."""
+        self._install_signal_handlers()
+
+        try:
+            self._create_bot()
+            await self.health.start()
+            self.supervisor.add("polling", self._run_polling)
+            self.supervisor.add("monitor", self._run_monitor)
+            self.supervisor.start()
+
+            self._started = True
+            self.metrics.mark_ready()
+
+            await self._stop_event.wait()
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        """
+        Плавная остановка приложения.
+
+        Мониторинг доводит текущую проверку до конца, пул браузеров
+        дожидается возврата драйверов, после чего закрываются соединения.
+        На оба ожидания вместе отводится не более SHUTDOWN_TIMEOUT.
+        """
+        self._stop_event.set()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.SHUTDOWN_TIMEOUT
+
+        if self.dispatcher is not None:
+            try:
+                await self.dispatcher.stop_polling()
+            except RuntimeError:
+                pass
+
+        await self.supervisor.stop(max(deadline - loop.time(), 0))
+        await self.resources.close(max(deadline - loop.time(), 0))
+        if self.bot is not None:
+            await self.bot.session.close()
+        await self.health.stop()
+        logger.info("Приложение остановлено")
+
+    def _create_bot(self) -> None:
+        """Создание бота и диспетчера aiogram."""
+        from aiogram import Bot, Dispatcher
+
+        self.bot = Bot(token=self.config.BOT_TOKEN)
+        self.dispatcher = Dispatcher()
+        self.dispatcher.update.outer_middleware(self._track_first_update)
+
+    async def _run_polling(self) -> None:
+        """Получение обновлений Telegram."""
+        await self.dispatcher.start_polling(
+            self.bot,
+            allowed_updates=self.dispatcher.resolve_used_update_types(),
+            handle_signals=False,
+            close_bot_session=False
+        )
+
+    async def _run_monitor(self) -> None:
+        """Периодическая проверка цен отслеживаемых товаров."""
+        from database.operations import DatabaseOperations
+        from parsers.manager import ParserManager
+
+        manager = ParserManager(self.resources.browser_pool)
+
+        while not self._stop_event.is_set():
+            async with self.resources.session_factory() as session:
+                products = await DatabaseOperations(session).get_active_products()
+
+            owners = {product.id: product.user_id for product in products}
+            self._notified = {
+                key: price for key, price in self._notified.items()
+                if key[0] in owners
+            }
+            await manager.monitor_once(
+                [
+                    {
+                        'id': product.id,
+                        'name': product.name,
+                        'target_price': product.target_price,
+                    }
+                    for product in products
+                ],
+                lambda found: self._on_price_found(found, owners)
+            )
+
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    self.config.PARSER_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _on_price_found(self, found: Dict[str, Any], owners: Dict[int, int]) -> None:
+        """
+        Сохранение найденной цены и уведомление пользователя.
+
+        Повторное уведомление по товару и магазину отправляется, только если
+        цена стала ниже той, о которой уже сообщили.
+
+        Args:
+            found: Информация о найденном товаре от менеджера парсеров
+            owners: Соответствие ID товара и ID его владельца
+        """
+        from database.operations import DatabaseOperations
+
+        async with self.resources.session_factory() as session:
+            await DatabaseOperations(session).add_price_history(
+                product_id=found['product_id'],
+                price=found['price'],
+                url=found['url'],
+                store=found['store']
+            )
+
+        key = (found['product_id'], found['store'])
+        notified = self._notified.get(key)
+        if notified is not None and found['price'] >= notified:
+            return
+
+        await self.bot.send_message(
+            owners[found['product_id']],
+            f"{found['name']} в {found['store']} за {found['price']} "
+            f"(цель: {found['target_price']})\n{found['url']}"
+        )
+        self._notified[key] = found['price']
+
+    async def _track_first_update(
+            self,
+            handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+            event: Any,
+            data: Dict[str, Any]
+    ) -> Any:
+        """Middleware для измерения времени до первого обработанного обновления."""
+        try:
+            return await handler(event, data)
+        finally:
+            self.metrics.mark_first_update()
+
+    def _install_signal_handlers(self) -> None:
+        """Остановка приложения по SIGINT и SIGTERM."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_shutdown)
+            except NotImplementedError:
+                pass
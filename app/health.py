@@ -0,0 +1,118 @@
+"""
+Проверки живости и готовности, метрики запуска.
+"""
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import time
+from loguru import logger
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+
+@dataclass
+class StartupMetrics:
+    """
+    Метрики запуска процесса.
+
+    Все отметки берутся из `time.monotonic()`, отсчет ведется от начала
+    выполнения `main.py`.
+    """
+    started_at: float
+    ready_at: Optional[float] = None
+    first_update_at: Optional[float] = None
+
+    def mark_ready(self) -> None:
+        """Отметка о готовности приложения к обработке обновлений."""
+        self.ready_at = time.monotonic()
+        logger.info(f"Приложение готово за {self.ready_at - self.started_at:.3f} с")
+
+    def mark_first_update(self) -> None:
+        """Отметка об обработке первого обновления Telegram."""
+        if self.first_update_at is not None:
+            return
+        self.first_update_at = time.monotonic()
+        logger.info(
+            f"Первое обновление обработано через "
+            f"{self.first_update_at - self.started_at:.3f} с после запуска"
+        )
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """
+        Метрики в секундах от запуска процесса.
+
+        Returns:
+            Dict[str, Optional[float]]: Время до готовности и до первого обновления
+        """
+        def since_start(moment: Optional[float]) -> Optional[float]:
+            return None if moment is None else round(moment - self.started_at, 3)
+
+        return {
+            "ready_seconds": since_start(self.ready_at),
+            "first_update_seconds": since_start(self.first_update_at),
+        }
+
+
+class HealthServer:
+    """
+    HTTP сервер для проверок живости и готовности.
+
+    `/healthz` отвечает, пока работает цикл событий. `/readyz` отвечает 200,
+    только если приложение запущено, не останавливается и все фоновые
+    задачи работают.
+    """
+
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            ready: Callable[[], bool],
+            report: Callable[[], Dict[str, Any]]
+    ):
+        """
+        Инициализация сервера.
+
+        Args:
+            host: Адрес для прослушивания
+            port: Порт для прослушивания
+            ready: Функция проверки готовности приложения
+            report: Функция получения подробного состояния приложения
+        """
+        self.host = host
+        self.port = port
+        self._ready = ready
+        self._report = report
+        self._runner: Optional["web.AppRunner"] = None
+
+    async def start(self) -> None:
+        """Запуск HTTP сервера."""
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/healthz", self._liveness)
+        app.router.add_get("/readyz", self._readiness)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Проверки состояния доступны на {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Остановка HTTP сервера."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _liveness(self, request: "web.Request") -> "web.Response":
+        from aiohttp import web
+
+        return web.json_response({"status": "ok"})
+
+    async def _readiness(self, request: "web.Request") -> "web.Response":
+        from aiohttp import web
+
+        ready = self._ready()
+        return web.json_response(
+            {"status": "ready" if ready else "not_ready", **self._report()},
+            status=200 if ready else 503
+        )
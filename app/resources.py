@@ -0,0 +1,106 @@
+"""
+Ленивая инициализация тяжелых подсистем: базы данных, Redis и пула браузеров.
+"""
+from typing import TYPE_CHECKING, Dict, Optional
+from loguru import logger
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+    from parsers.pool import BrowserPool
+
+
+class Resources:
+    """
+    Контейнер общих ресурсов приложения.
+
+    Каждый ресурс создается при первом обращении, поэтому запуск процесса
+    не ждет подключения к базе данных, Redis или запуска браузеров.
+    """
+
+    def __init__(self, config: Settings):
+        """
+        Инициализация контейнера.
+
+        Args:
+            config: Настройки приложения
+        """
+        self.config = config
+        self._engine: Optional["AsyncEngine"] = None
+        self._session_factory: Optional["async_sessionmaker[AsyncSession]"] = None
+        self._redis: Optional["Redis"] = None
+        self._browser_pool: Optional["BrowserPool"] = None
+
+    @property
+    def session_factory(self) -> "async_sessionmaker[AsyncSession]":
+        """Фабрика асинхронных сессий SQLAlchemy."""
+        if self._session_factory is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+            self._engine = create_async_engine(
+                self.config.database_url,
+                pool_pre_ping=True
+            )
+            self._session_factory = async_sessionmaker(
+                self._engine,
+                expire_on_commit=False
+            )
+            logger.info("Создано подключение к базе данных")
+        return self._session_factory
+
+    @property
+    def redis(self) -> "Redis":
+        """Клиент Redis."""
+        if self._redis is None:
+            from redis.asyncio import from_url
+
+            self._redis = from_url(self.config.redis_url)
+            logger.info("Создан клиент Redis")
+        return self._redis
+
+    @property
+    def browser_pool(self) -> "BrowserPool":
+        """Пул браузеров для парсеров."""
+        if self._browser_pool is None:
+            from parsers.pool import BrowserPool
+
+            self._browser_pool = BrowserPool(self.config.BROWSER_POOL_SIZE)
+        return self._browser_pool
+
+    def status(self) -> Dict[str, bool]:
+        """
+        Состояние ресурсов без их инициализации.
+
+        Returns:
+            Dict[str, bool]: Признак инициализации для каждого ресурса
+        """
+        return {
+            "database": self._engine is not None,
+            "redis": self._redis is not None,
+            "browser_pool": self._browser_pool is not None,
+        }
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Освобождение созданных ресурсов.
+
+        Пул браузеров закрывается первым и дожидается текущих парсингов.
+
+        Args:
+            timeout: Максимальное время ожидания возврата драйверов в пул
+        """
+        if self._browser_pool is not None:
+            await self._browser_pool.close(timeout)
+            self._browser_pool = None
+
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_factory = None
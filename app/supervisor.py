@@ -0,0 +1,110 @@
+"""
+Супервизор фоновых задач приложения.
+"""
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+import asyncio
+from loguru import logger
+
+
+@dataclass
+class Service:
+    """Описание фоновой задачи под управлением супервизора."""
+    name: str
+    factory: Callable[[], Awaitable[None]]
+    restarts: int = 0
+    task: Optional[asyncio.Task] = None
+
+
+class Supervisor:
+    """
+    Запуск фоновых задач с перезапуском после ошибок.
+
+    Упавшая задача перезапускается с экспоненциальной задержкой. Задача,
+    завершившаяся без ошибки, считается выполненной и не перезапускается.
+    """
+
+    MAX_BACKOFF = 60
+
+    def __init__(self):
+        self.services: Dict[str, Service] = {}
+        self._stopping = asyncio.Event()
+
+    def add(self, name: str, factory: Callable[[], Awaitable[None]]) -> None:
+        """
+        Регистрация фоновой задачи.
+
+        Args:
+            name: Имя задачи для логов и проверки готовности
+            factory: Функция, возвращающая корутину задачи
+        """
+        self.services[name] = Service(name=name, factory=factory)
+
+    def start(self) -> None:
+        """Запуск всех зарегистрированных задач."""
+        for service in self.services.values():
+            service.task = asyncio.create_task(
+                self._run(service),
+                name=service.name
+            )
+
+    def status(self) -> Dict[str, bool]:
+        """
+        Состояние задач.
+
+        Returns:
+            Dict[str, bool]: Признак работы для каждой задачи
+        """
+        return {
+            name: service.task is not None and not service.task.done()
+            for name, service in self.services.items()
+        }
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Остановка задач.
+
+        Задачам дается время завершиться самостоятельно, после чего
+        оставшиеся отменяются.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах
+        """
+        self._stopping.set()
+        tasks = [
+            service.task for service in self.services.values()
+            if service.task is not None
+        ]
+        if not tasks:
+            return
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            logger.warning(f"Задача {task.get_name()} не завершилась вовремя, отменяем")
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, service: Service) -> None:
+        """Выполнение задачи с перезапуском после ошибок."""
+        while not self._stopping.is_set():
+            try:
+                await service.factory()
+                logger.info(f"Задача {service.name} завершена")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._stopping.is_set():
+                    logger.error(f"Задача {service.name} упала при остановке: {e}")
+                    return
+                service.restarts += 1
+                delay = min(2 ** service.restarts, self.MAX_BACKOFF)
+                logger.exception(
+                    f"Задача {service.name} упала, перезапуск через {delay} с: {e}"
+                )
+
+            # Ожидание перед перезапуском прерывается остановкой супервизора
+            try:
+                await asyncio.wait_for(self._stopping.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
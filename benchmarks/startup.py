@@ -0,0 +1,121 @@
+"""
+Замер времени запуска бота.
+
+Измеряет время от старта процесса до готовности приложения и до обработки
+первого обновления Telegram, а также проверяет, что импорт точки входа
+не подтягивает тяжелые зависимости. Сеть не используется: polling подменяется
+подачей одного обновления в диспетчер, мониторинг цен не запускается.
+
+Запуск:
+    python benchmarks/startup.py [--output bench_output.txt]
+"""
+import time
+
+# Отметка запуска процесса берется до остальных импортов
+STARTED_AT = time.monotonic()
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+HEAVY_MODULES = ("selenium", "undetected_chromedriver", "sqlalchemy", "redis")
+
+# Настройки-заглушки: к базе данных, Redis и Telegram бенчмарк не обращается
+DEFAULT_ENV = {
+    "BOT_TOKEN": "42:BENCHMARK",
+    "POSTGRES_DB": "db",
+    "POSTGRES_USER": "user",
+    "POSTGRES_PASSWORD": "password",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "REDIS_PASSWORD": "password",
+    "CHROME_DRIVER_PATH": "/usr/bin/chromedriver",
+    "HEALTH_HOST": "127.0.0.1",
+    "HEALTH_PORT": "0",
+}
+
+
+def loaded_heavy_modules() -> list:
+    """Тяжелые зависимости, уже загруженные в процесс."""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+async def measure() -> dict:
+    """
+    Запуск приложения до первого обработанного обновления.
+
+    Returns:
+        dict: Метрики запуска и загруженные тяжелые модули
+    """
+    import main  # noqa: F401
+    import parsers.manager  # noqa: F401
+    from app.bootstrap import Application
+    from app.health import StartupMetrics
+    from config import get_config
+
+    imported = loaded_heavy_modules()
+
+    application = Application(get_config(), StartupMetrics(started_at=STARTED_AT))
+    handled = asyncio.Event()
+
+    async def run_polling():
+        from aiogram.types import Update
+
+        update = Update.model_validate({
+            "update_id": 1,
+            "message": {
+                "message_id": 1,
+                "date": 0,
+                "chat": {"id": 1, "type": "private"},
+                "text": "/start",
+            },
+        })
+        await application.dispatcher.feed_update(application.bot, update)
+        handled.set()
+        await application._stop_event.wait()
+
+    async def run_monitor():
+        await application._stop_event.wait()
+
+    application._run_polling = run_polling
+    application._run_monitor = run_monitor
+
+    running = asyncio.create_task(application.run())
+    await asyncio.wait_for(handled.wait(), 30)
+    at_first_update = loaded_heavy_modules()
+    application.request_shutdown()
+    await running
+
+    return {
+        **application.metrics.as_dict(),
+        "heavy_modules_after_import": imported,
+        "heavy_modules_at_first_update": at_first_update,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Файл, в который дописывается результат")
+    args = parser.parse_args()
+
+    for name, value in DEFAULT_ENV.items():
+        os.environ.setdefault(name, value)
+
+    result = json.dumps(asyncio.run(measure()))
+    print(result)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output:
+            output.write(result + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """
 Конфигурация проекта с использованием Pydantic для валидации.
 """
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, validator
@@ -51,6 +52,12 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Настройки запуска и остановки приложения
+    BROWSER_POOL_SIZE: int = 2
+    SHUTDOWN_TIMEOUT: int = 30  # секунд на завершение текущих проверок
+    HEALTH_HOST: str = "0.0.0.0"
+    HEALTH_PORT: int = 8080
+
     @validator("ADMIN_IDS", pre=True)
     def parse_admin_ids(cls, v: str | List[int]) -> List[int]:
         """Преобразование строки с ID администраторов в список целых чисел."""
@@ -65,5 +72,22 @@ class Settings(BaseSettings):
     )
 
 
-# Создание экземпляра конфигурации
-config = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> Settings:
+    """
+    Получение экземпляра конфигурации.
+
+    Настройки читаются из окружения при первом обращении, а не при импорте
+    модуля, чтобы импорт не требовал заполненного окружения.
+
+    Returns:
+        Settings: Экземпляр конфигурации
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Ленивый доступ к `config` для совместимости с `from config import config`."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,362 @@
+"""
+Агрегаты цен и запросы для графиков и статистики.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import case, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import PriceHistory, PriceRollup
+
+HOUR = "hour"
+DAY = "day"
+GRANULARITIES = (HOUR, DAY)
+
+
+@dataclass
+class PriceStats:
+    """Статистика цен товара за период."""
+    min_price: float
+    max_price: float
+    avg_price: float
+    last_price: float
+    count: int
+
+
+@dataclass
+class PricePoint:
+    """Точка графика цен."""
+    bucket_start: datetime
+    min_price: float
+    max_price: float
+    avg_price: float
+    last_price: float
+    count: int = 1
+
+
+def to_utc(moment: datetime) -> datetime:
+    """
+    Приведение момента времени к UTC.
+
+    Время без часового пояса считается UTC, как `datetime.utcnow()`
+    в моделях.
+
+    Args:
+        moment: Момент времени
+
+    Returns:
+        datetime: Момент времени с часовым поясом UTC
+    """
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """
+    Начало периода в UTC, к которому относится момент времени.
+
+    Границы периодов совпадают с теми, что считает `rebuild_rollups`
+    в базе данных, независимо от часового пояса сервера.
+
+    Args:
+        moment: Момент времени
+        granularity: Размер периода: `hour` или `day`
+
+    Returns:
+        datetime: Начало часа или суток в UTC
+    """
+    moment = to_utc(moment)
+    if granularity == HOUR:
+        return moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == DAY:
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Неизвестный размер периода: {granularity}")
+
+
+async def update_price_rollups(session: AsyncSession, history: PriceHistory) -> None:
+    """
+    Учет новой записи истории цен в часовом и дневном агрегатах.
+
+    Обновление выполняется одним запросом `INSERT ... ON CONFLICT` на каждый
+    агрегат, поэтому параллельные записи не теряются. Фиксация транзакции
+    остается за вызывающим кодом.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        history: Запись истории цен с заполненным `created_at`
+    """
+    for granularity in GRANULARITIES:
+        query = insert(PriceRollup).values(
+            product_id=history.product_id,
+            store=history.store,
+            granularity=granularity,
+            bucket_start=bucket_start(history.created_at, granularity),
+            min_price=history.price,
+            max_price=history.price,
+            sum_price=history.price,
+            count=1,
+            last_price=history.price,
+            last_at=to_utc(history.created_at)
+        )
+        excluded = query.excluded
+        query = query.on_conflict_do_update(
+            constraint="uq_price_rollups_bucket",
+            set_={
+                "min_price": func.least(PriceRollup.min_price, excluded.min_price),
+                "max_price": func.greatest(PriceRollup.max_price, excluded.max_price),
+                "sum_price": PriceRollup.sum_price + excluded.sum_price,
+                "count": PriceRollup.count + excluded.count,
+                "last_price": case(
+                    (excluded.last_at >= PriceRollup.last_at, excluded.last_price),
+                    else_=PriceRollup.last_price
+                ),
+                "last_at": func.greatest(PriceRollup.last_at, excluded.last_at),
+                "updated_at": excluded.updated_at,
+            }
+        )
+        await session.execute(query)
+
+
+def downsample(points: List[PricePoint], max_points: int) -> List[PricePoint]:
+    """
+    Сокращение количества точек графика.
+
+    Соседние точки объединяются в группы одинакового размера: минимум и
+    максимум берутся по группе, средняя цена усредняется с учетом количества
+    замеров, последняя цена берется из последней точки группы.
+
+    Args:
+        points: Точки графика, отсортированные по времени
+        max_points: Максимальное количество точек в результате
+
+    Returns:
+        List[PricePoint]: Точки графика не более `max_points`
+    """
+    if max_points <= 0 or len(points) <= max_points:
+        return points
+
+    # NumPy импортируется только для длинных графиков
+    import numpy as np
+
+    mins = np.fromiter((p.min_price for p in points), dtype=float, count=len(points))
+    maxs = np.fromiter((p.max_price for p in points), dtype=float, count=len(points))
+    avgs = np.fromiter((p.avg_price for p in points), dtype=float, count=len(points))
+    lasts = np.fromiter((p.last_price for p in points), dtype=float, count=len(points))
+    weights = np.fromiter((p.count for p in points), dtype=float, count=len(points))
+
+    starts = np.unique(np.linspace(0, len(points), max_points, endpoint=False).astype(int))
+    ends = np.append(starts[1:], len(points)) - 1
+
+    group_min = np.minimum.reduceat(mins, starts)
+    group_max = np.maximum.reduceat(maxs, starts)
+    group_count = np.add.reduceat(weights, starts)
+    group_avg = np.add.reduceat(avgs * weights, starts) / group_count
+
+    return [
+        PricePoint(
+            bucket_start=points[start].bucket_start,
+            min_price=float(low),
+            max_price=float(high),
+            avg_price=float(avg),
+            last_price=float(lasts[end]),
+            count=int(count)
+        )
+        for start, end, low, high, avg, count in zip(
+            starts.tolist(), ends.tolist(), group_min, group_max, group_avg, group_count
+        )
+    ]
+
+
+class PriceAnalytics:
+    """Класс для запросов статистики и графиков цен по агрегатам."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация запросов аналитики.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+        """
+        self.session = session
+
+    async def get_price_stats(
+        self,
+        product_id: int,
+        days: int = 30,
+        store: Optional[str] = None
+    ) -> Optional[PriceStats]:
+        """
+        Статистика цен товара за последние дни.
+
+        Считается по дневным агрегатам, включая текущие неполные сутки.
+
+        Args:
+            product_id: ID товара
+            days: Количество дней
+            store: Название магазина или None для всех магазинов
+
+        Returns:
+            Optional[PriceStats]: Статистика или None, если замеров не было
+        """
+        since = bucket_start(datetime.now(timezone.utc), DAY) - timedelta(days=days - 1)
+        conditions = self._conditions(product_id, DAY, since, None, store)
+
+        query = select(
+            func.min(PriceRollup.min_price),
+            func.max(PriceRollup.max_price),
+            func.sum(PriceRollup.sum_price),
+            func.sum(PriceRollup.count),
+            func.array_agg(
+                aggregate_order_by(PriceRollup.last_price, PriceRollup.last_at.desc())
+            )[1]
+        ).where(*conditions)
+        result = await self.session.execute(query)
+        min_price, max_price, sum_price, count, last_price = result.one()
+
+        if not count:
+            return None
+
+        return PriceStats(
+            min_price=min_price,
+            max_price=max_price,
+            avg_price=sum_price / count,
+            last_price=last_price,
+            count=count
+        )
+
+    async def get_price_chart(
+        self,
+        product_id: int,
+        start: datetime,
+        end: datetime,
+        granularity: str = HOUR,
+        store: Optional[str] = None,
+        max_points: int = 200
+    ) -> List[PricePoint]:
+        """
+        Точки графика цен товара за период.
+
+        Если магазин не указан, агрегаты разных магазинов объединяются
+        в одну точку на период.
+
+        Args:
+            product_id: ID товара
+            start: Начало периода
+            end: Конец периода (не включительно)
+            granularity: Размер периода точки: `hour` или `day`
+            store: Название магазина или None для всех магазинов
+            max_points: Максимальное количество точек, 0 — без ограничения
+
+        Returns:
+            List[PricePoint]: Точки графика, отсортированные по времени
+        """
+        conditions = self._conditions(
+            product_id, granularity, bucket_start(start, granularity), to_utc(end), store
+        )
+
+        query = select(
+            PriceRollup.bucket_start,
+            func.min(PriceRollup.min_price),
+            func.max(PriceRollup.max_price),
+            func.sum(PriceRollup.sum_price),
+            func.sum(PriceRollup.count),
+            func.array_agg(
+                aggregate_order_by(PriceRollup.last_price, PriceRollup.last_at.desc())
+            )[1]
+        ).where(
+            *conditions
+        ).group_by(
+            PriceRollup.bucket_start
+        ).order_by(PriceRollup.bucket_start)
+        result = await self.session.execute(query)
+
+        points = [
+            PricePoint(
+                bucket_start=bucket,
+                min_price=min_price,
+                max_price=max_price,
+                avg_price=sum_price / count,
+                last_price=last_price,
+                count=count
+            )
+            for bucket, min_price, max_price, sum_price, count, last_price in result
+        ]
+
+        return downsample(points, max_points)
+
+    async def rebuild_rollups(self, product_id: int) -> None:
+        """
+        Пересчет агрегатов товара по полной истории цен.
+
+        Нужен для истории, записанной до появления агрегатов.
+
+        Args:
+            product_id: ID товара
+        """
+        await self.session.execute(
+            delete(PriceRollup).where(PriceRollup.product_id == product_id)
+        )
+
+        for granularity in GRANULARITIES:
+            # Усечение в UTC, как в bucket_start(), а не в часовом поясе сессии
+            bucket = func.timezone(
+                "UTC",
+                func.date_trunc(granularity, func.timezone("UTC", PriceHistory.created_at))
+            )
+            now = func.now()
+            query = select(
+                PriceHistory.product_id,
+                PriceHistory.store,
+                literal(granularity),
+                bucket,
+                func.min(PriceHistory.price),
+                func.max(PriceHistory.price),
+                func.sum(PriceHistory.price),
+                func.count(),
+                func.array_agg(
+                    aggregate_order_by(PriceHistory.price, PriceHistory.created_at.desc())
+                )[1],
+                func.max(PriceHistory.created_at),
+                now,
+                now
+            ).where(
+                PriceHistory.product_id == product_id
+            ).group_by(
+                PriceHistory.product_id, PriceHistory.store, bucket
+            )
+            await self.session.execute(
+                insert(PriceRollup).from_select(
+                    [
+                        "product_id", "store", "granularity", "bucket_start",
+                        "min_price", "max_price", "sum_price", "count",
+                        "last_price", "last_at", "created_at", "updated_at",
+                    ],
+                    query
+                )
+            )
+
+        await self.session.commit()
+
+    @staticmethod
+    def _conditions(
+        product_id: int,
+        granularity: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        store: Optional[str]
+    ) -> list:
+        """Условия выборки агрегатов товара за период."""
+        conditions = [
+            PriceRollup.product_id == product_id,
+            PriceRollup.granularity == granularity,
+        ]
+        if start is not None:
+            conditions.append(PriceRollup.bucket_start >= start)
+        if end is not None:
+            conditions.append(PriceRollup.bucket_start < end)
+        if store is not None:
+            conditions.append(PriceRollup.store == store)
+        return conditions
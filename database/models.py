@@ -3,7 +3,10 @@
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import BigInteger, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import (
+    BigInteger, String, Float, Integer, DateTime, ForeignKey, Boolean, Index,
+    UniqueConstraint
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -90,4 +93,51 @@ class PriceHistory(Base):
     product: Mapped[Product] = relationship(back_populates="price_history")
 
     def __repr__(self) -> str:
-        return f"<PriceHistory {self.store} - {self.price}>"
\ No newline at end of file
+        return f"<PriceHistory {self.store} - {self.price}>"
+
+
+class PriceRollup(Base):
+    """
+    Модель агрегата цен за период (час или сутки).
+
+    Агрегаты обновляются при каждой записи в историю цен и позволяют строить
+    графики и статистику без чтения всей истории.
+    """
+
+    __tablename__ = "price_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "product_id", "store", "granularity", "bucket_start",
+            name="uq_price_rollups_bucket"
+        ),
+        # Графики и статистика по всем магазинам не фильтруют по store
+        Index(
+            "ix_price_rollups_product_granularity_bucket",
+            "product_id", "granularity", "bucket_start"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    store: Mapped[str] = mapped_column(String(50), nullable=False)
+    granularity: Mapped[str] = mapped_column(String(8), nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    min_price: Mapped[float] = mapped_column(Float, nullable=False)
+    max_price: Mapped[float] = mapped_column(Float, nullable=False)
+    sum_price: Mapped[float] = mapped_column(Float, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_price: Mapped[float] = mapped_column(Float, nullable=False)
+    last_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Внешние ключи
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    @property
+    def avg_price(self) -> float:
+        """Средняя цена за период."""
+        return self.sum_price / self.count
+
+    def __repr__(self) -> str:
+        return f"<PriceRollup {self.store} {self.granularity} {self.bucket_start}>"
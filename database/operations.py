@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from .analytics import update_price_rollups
 from .models import User, Product, PriceHistory
 
 
@@ -83,6 +84,17 @@ class DatabaseOperations:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_active_products(self) -> List[Product]:
+        """
+        Получение всех активных товаров для мониторинга цен.
+
+        Returns:
+            List[Product]: Список активных товаров всех пользователей
+        """
+        query = select(Product).where(Product.is_active == True)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def delete_product(self, user_id: int, product_id: int) -> bool:
         """
         Удаление товара пользователя.
@@ -118,6 +130,8 @@ class DatabaseOperations:
     ) -> PriceHistory:
         """
         Добавление записи в историю цен.
+
+        Часовой и дневной агрегаты цен обновляются в той же транзакции.
         
         Args:
             product_id: ID товара
@@ -135,6 +149,8 @@ class DatabaseOperations:
             store=store
         )
         self.session.add(history)
+        await self.session.flush()
+        await update_price_rollups(self.session, history)
         await self.session.commit()
         await self.session.refresh(history)
         return history
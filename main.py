@@ -0,0 +1,30 @@
+"""
+Точка входа бота.
+"""
+import time
+
+# Отметка запуска процесса берется до остальных импортов
+STARTED_AT = time.monotonic()
+
+import asyncio
+import sys
+from loguru import logger
+
+from config import get_config
+
+
+def main() -> None:
+    """Запуск приложения."""
+    config = get_config()
+    logger.remove()
+    logger.add(sys.stderr, level=config.LOG_LEVEL)
+
+    from app.bootstrap import Application
+    from app.health import StartupMetrics
+
+    application = Application(config, StartupMetrics(started_at=STARTED_AT))
+    asyncio.run(application.run())
+
+
+if __name__ == "__main__":
+    main()
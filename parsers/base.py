@@ -3,16 +3,15 @@
 '''
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 import asyncio
 import aiohttp
 from loguru import logger
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from undetected_chromedriver import Chrome
 
-from config import config
+from config import get_config
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 
 @dataclass
@@ -23,13 +22,50 @@ class ParserProduct:
     url: str
     store: str
 
+
+def create_driver() -> 'webdriver.Chrome':
+    '''
+    Создание Selenium драйвера.
+
+    Selenium и undetected_chromedriver импортируются здесь, а не на уровне
+    модуля, чтобы не замедлять запуск процесса до первого парсинга.
+
+    Returns:
+        webdriver.Chrome: Новый экземпляр драйвера
+    '''
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from undetected_chromedriver import Chrome
+
+    config = get_config()
+    chrome_options = Options()
+    if config.HEADLESS:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+
+    service = Service(executable_path=config.CHROME_DRIVER_PATH)
+    return Chrome(
+        service=service,
+        options=chrome_options
+    )
+
+
 class BaseParser(ABC):
     """Базовый класс для всех парсеров."""
     
-    def __init__(self):
-        self.name: str = self.__class__.__name___
+    def __init__(self, driver: Optional['webdriver.Chrome'] = None):
+        '''
+        Инициализация парсера.
+
+        Args:
+            driver: Драйвер из пула браузеров. Переданный драйвер не
+                закрывается парсером и возвращается в пул владельцем.
+        '''
+        self.name: str = self.__class__.__name__
         self.session: Optional[aiohttp.ClientSession] = None
-        self.driver: Optional[webdriver.Chrome] = None
+        self.driver: Optional['webdriver.Chrome'] = driver
+        self._owns_driver: bool = driver is None
 
     async def __aenter__(self):
         '''Создание сессии для HTTP запросов.'''
@@ -42,25 +78,36 @@ class BaseParser(ABC):
         if self.session:
             await self.session.close()
             self.session = None
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        if self.driver and self._owns_driver:
+            await asyncio.to_thread(self.driver.quit)
+        self.driver = None
     
     def _init_selenuim(self) -> None:
         '''Инициализация Selenium драйвера'''
-        chrome_options = Options()
-        if config.HEADLESS:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-
-        service = Service(executable_path=config.CHROME_DRIVER_PATH)
-        self.driver = Chrome(
-            service=service,
-            options=chrome_options
-        )
+        self.driver = create_driver()
+        self._owns_driver = True
+
+    async def _load_page(self, url: str, wait: float = 0) -> str:
+        '''
+        Загрузка страницы в браузере.
+
+        Вызовы Selenium блокирующие, поэтому выполняются в отдельном потоке,
+        чтобы не останавливать цикл событий на время парсинга.
+
+        Args:
+            url: URL страницы
+            wait: Пауза после загрузки для отрисовки динамического контента
+
+        Returns:
+            str: HTML код страницы
+        '''
+        await asyncio.to_thread(self.driver.get, url)
+        if wait:
+            await asyncio.sleep(wait)
+        return await asyncio.to_thread(lambda: self.driver.page_source)
+
     @abstractmethod
-    async def search_product(self, query: str) -> List[ParsedProduct]:
+    async def search_product(self, query: str) -> List[ParserProduct]:
         """
         Поиск товара на сайте магазина.
         
@@ -1,11 +1,13 @@
 '''
 Менеджер для управления парсерами магазинов.
 '''
-from typing import Dict, Type, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Type, List, Optional
 import asyncio
 from loguru import logger
 
 from .base import BaseParser, ParserProduct
+from .pool import BrowserPool
 from .sites.ozon import OzonParser
 #TODO: доделать остальные парсеры
 
@@ -15,7 +17,15 @@ class ParserManager:
     Класс менеджера парсеров
     '''
 
-    def __init__(self):
+    def __init__(self, browser_pool: Optional[BrowserPool] = None):
+        '''
+        Инициализация менеджера.
+
+        Args:
+            browser_pool: Пул браузеров. Без пула каждый парсер
+                создает собственный драйвер
+        '''
+        self.browser_pool = browser_pool
         self.parsers: Dict[str, Type[BaseParser]] = {
             'ozon': OzonParser,
             #TODO: доделать остальные парсеры
@@ -31,21 +41,17 @@ class ParserManager:
         Returns:
             List[ParsedProduct]: Список найденных товаров
         """
-        tasks = []
         result = []
 
-        for store_name, parser_class in self.parsers.items():
-            async with parser_class() as parser:
-                try:
-                    #Создаем задачи для каждого парсера
-                    task = asyncio.create_task(parser_class.search_product(query))
-                    task.append(tasks)
-                except Exception as e:
-                    logger.error(f'Ошибка при создании парсера {store_name}: {e}')
+        #Создаем задачи для каждого парсера
+        tasks = [
+            asyncio.create_task(self._search_store(parser_class, query))
+            for parser_class in self.parsers.values()
+        ]
 
         #ждем выполнения всех задач
         if tasks:
-            complete_tasks = await asyncio.gather(**tasks, return_exceptions=True)
+            complete_tasks = await asyncio.gather(*tasks, return_exceptions=True)
 
             for store_name, task_result in zip(self.parsers.keys(), complete_tasks):
                 if isinstance(task_result, Exception):
@@ -57,6 +63,38 @@ class ParserManager:
                     result.extend(task_result)
         
         return result
+
+    async def _search_store(
+            self,
+            parser_class: Type[BaseParser],
+            query: str
+    ) -> List[ParserProduct]:
+        '''Поиск товара в одном магазине.'''
+        async with self._open_parser(parser_class) as parser:
+            return await parser.search_product(query)
+
+    @asynccontextmanager
+    async def _open_parser(
+            self,
+            parser_class: Type[BaseParser]
+    ) -> AsyncIterator[BaseParser]:
+        '''
+        Создание парсера с драйвером из пула, если пул задан.
+
+        Args:
+            parser_class: Класс парсера
+
+        Yields:
+            BaseParser: Готовый к работе парсер
+        '''
+        if self.browser_pool is None:
+            async with parser_class() as parser:
+                yield parser
+            return
+
+        async with self.browser_pool.acquire() as driver:
+            async with parser_class(driver) as parser:
+                yield parser
     
     async def check_price(
             self,
@@ -79,56 +117,118 @@ class ParserManager:
             return None
         
         try:
-            async with parser_class() as parser:
+            async with self._open_parser(parser_class) as parser:
                 return await parser.get_product_price(url)
         except Exception as e:
             logger.error(f'Ошибка при проверке цен в {store}: {e}')
             return None
         
-    async def monitor_prices(
+    async def monitor_once(
             self,
             products: List[dict],
             callback
     ) -> None:
         """
-        Мониторинг цен для списка товаров.
+        Однократная проверка цен для списка товаров.
+
+        Для каждого товара и магазина в callback передается только самое
+        дешевое предложение, название которого содержит все слова названия
+        товара. Ошибка в callback не прерывает обработку остальных товаров.
         
         Args:
             products: Список товаров для мониторинга
             callback: Функция обратного вызова для обработки найденных товаров
         """
-        while True:
-            tasks = []
+        tasks = []
+
+        for product in products:
+            #Создаем задачи поиска для каждого товара
+            search_task = self.search_all_stores(product['name'])
+            tasks.append(search_task)
+
+        if not tasks:
+            return
+
+        search_result = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for product, found_products in zip(products, search_result):
+            if isinstance(found_products, Exception):
+                logger.error(f"Ошибка при поиске {product['name']}: {found_products}")
+                continue
 
-            for product in products:
-                #Создаем задачи поиска для каждого товара
-                search_task = self.search_all_stores(product['name'])
-                tasks.append(search_task)
+            target_price = product['target_price']
 
-            if tasks:
+            for found_product in self._best_offers(product['name'], found_products):
+                if found_product.price > target_price:
+                    continue
                 try:
-                    search_result = await asyncio.gather(**tasks, return_exceptions=True)
-
-                    for product, found_products in zip(products, search_result):
-                        if isinstance(found_products, Exception):
-                            logger.error(f'Ошибка при поиске {product['name']}: {found_products}')
-                            continue
-
-                        target_price = product['target_price']
-
-                        for found_product in found_products:
-                            if found_products.price <= target_price:
-                                #Вызываем callback c информацией о найденом товаре
-                                await callback({
-                                    'product_id': product['id'],
-                                    'name': found_product.name,
-                                    'price': found_product.price,
-                                    'url': found_product.url,
-                                    'store': found_product.store,
-                                    'target_price': target_price
-                                })
+                    #Вызываем callback c информацией о найденом товаре
+                    await callback({
+                        'product_id': product['id'],
+                        'name': found_product.name,
+                        'price': found_product.price,
+                        'url': found_product.url,
+                        'store': found_product.store,
+                        'target_price': target_price
+                    })
                 except Exception as e:
-                    logger.error(f'Ошибка при мониторинге цен: {e}')
+                    logger.error(
+                        f"Ошибка при обработке цены {product['name']} "
+                        f"в {found_product.store}: {e}"
+                    )
+
+    @staticmethod
+    def _best_offers(
+            query: str,
+            found_products: List[ParserProduct]
+    ) -> List[ParserProduct]:
+        '''
+        Самые дешевые подходящие предложения в каждом магазине.
+
+        Args:
+            query: Название отслеживаемого товара
+            found_products: Результаты поиска во всех магазинах
+
+        Returns:
+            List[ParserProduct]: Не более одного предложения на магазин
+        '''
+        words = query.lower().split()
+        best: Dict[str, ParserProduct] = {}
+
+        for found_product in found_products:
+            name = found_product.name.lower()
+            if not all(word in name for word in words):
+                continue
+            current = best.get(found_product.store)
+            if current is None or found_product.price < current.price:
+                best[found_product.store] = found_product
+
+        return list(best.values())
+
+    async def monitor_prices(
+            self,
+            products: List[dict],
+            callback,
+            interval: int = 600,
+            stop_event: Optional[asyncio.Event] = None
+    ) -> None:
+        """
+        Мониторинг цен для списка товаров.
+        
+        Args:
+            products: Список товаров для мониторинга
+            callback: Функция обратного вызова для обработки найденных товаров
+            interval: Пауза между проверками в секундах
+            stop_event: Событие остановки. Текущая проверка доводится
+                до конца, следующая не начинается
+        """
+        stop_event = stop_event or asyncio.Event()
+
+        while not stop_event.is_set():
+            await self.monitor_once(products, callback)
 
-            #ждем следующую проверку 10 минут
-            await asyncio.sleep(600)
\ No newline at end of file
+            #ждем следующую проверку
+            try:
+                await asyncio.wait_for(stop_event.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
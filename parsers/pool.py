@@ -0,0 +1,141 @@
+'''
+Пул Selenium драйверов для парсеров.
+'''
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Callable, List, Optional
+import asyncio
+from loguru import logger
+
+from .base import create_driver
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+class BrowserPool:
+    '''
+    Пул браузеров с ленивым созданием драйверов.
+
+    Драйверы создаются при первом запросе, а не при запуске приложения,
+    и переиспользуются между парсерами. При закрытии пул перестает выдавать
+    драйверы и дожидается возврата уже выданных.
+    '''
+
+    def __init__(
+            self,
+            size: int,
+            factory: Callable[[], 'webdriver.Chrome'] = create_driver
+    ):
+        '''
+        Инициализация пула.
+
+        Args:
+            size: Максимальное количество одновременно работающих драйверов
+            factory: Функция создания нового драйвера
+        '''
+        self.size = size
+        self._factory = factory
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: List['webdriver.Chrome'] = []
+        self._created: int = 0
+        self._in_use: int = 0
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._closing: bool = False
+
+    @property
+    def in_use(self) -> int:
+        '''Количество заемщиков, включая тех, для кого драйвер еще создается.'''
+        return self._in_use
+
+    @property
+    def created(self) -> int:
+        '''Количество созданных драйверов.'''
+        return self._created
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator['webdriver.Chrome']:
+        '''
+        Получение драйвера из пула.
+
+        Драйвер, на котором парсер упал с ошибкой, закрывается и не
+        возвращается в пул.
+
+        Yields:
+            webdriver.Chrome: Драйвер браузера
+        '''
+        self._check_open()
+
+        async with self._semaphore:
+            # Пул мог начать закрываться, пока ждали свободного места
+            self._check_open()
+
+            # Заемщик учитывается до создания драйвера, чтобы close()
+            # дождался и драйверов, которые еще запускаются
+            self._in_use += 1
+            self._drained.clear()
+            driver = None
+            broken = False
+            try:
+                driver = await self._take()
+                self._check_open()
+                yield driver
+            except BaseException:
+                broken = True
+                raise
+            finally:
+                self._in_use -= 1
+                if driver is not None:
+                    if broken or self._closing:
+                        await self._quit(driver)
+                    else:
+                        self._idle.append(driver)
+                if not self._in_use:
+                    self._drained.set()
+
+    async def close(self, timeout: Optional[float] = None) -> bool:
+        '''
+        Закрытие пула с ожиданием текущих парсингов.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            bool: True если все выданные драйверы были возвращены
+        '''
+        self._closing = True
+        drained = True
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+        except asyncio.TimeoutError:
+            drained = False
+            logger.warning(
+                f'Пул браузеров: {self._in_use} драйверов не вернулись '
+                f'за {timeout} с'
+            )
+
+        while self._idle:
+            await self._quit(self._idle.pop())
+        return drained
+
+    def _check_open(self) -> None:
+        '''Проверка, что пул не закрывается.'''
+        if self._closing:
+            raise RuntimeError('Пул браузеров закрывается')
+
+    async def _take(self) -> 'webdriver.Chrome':
+        '''Получение свободного драйвера или создание нового.'''
+        if self._idle:
+            return self._idle.pop()
+        driver = await asyncio.to_thread(self._factory)
+        self._created += 1
+        logger.info(f'Пул браузеров: создан драйвер ({self._created}/{self.size})')
+        return driver
+
+    async def _quit(self, driver: 'webdriver.Chrome') -> None:
+        '''Закрытие драйвера без блокировки цикла событий.'''
+        self._created -= 1
+        try:
+            await asyncio.to_thread(driver.quit)
+        except Exception as e:
+            logger.error(f'Ошибка при закрытии драйвера: {e}')
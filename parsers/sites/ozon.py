@@ -1,13 +1,15 @@
 '''
 Парсер для Ozon
 '''
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from bs4 import BeautifulSoup
 from loguru import logger
-import asyncio
 
 from ..base import BaseParser, ParserProduct
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 
 class OzonParser(BaseParser):
     '''Класс парсер для Ozon'''
@@ -15,9 +17,10 @@ class OzonParser(BaseParser):
     BASE_URL = 'https://www.ozon.ru'
     SEARCH_URL = f'{BASE_URL}/search'
 
-    def __init__(self):
-        super().__init__()
-        self._init_selenuim()
+    def __init__(self, driver: Optional['webdriver.Chrome'] = None):
+        super().__init__(driver)
+        if self.driver is None:
+            self._init_selenuim()
 
     async def search_product(self, query: str) -> List[ParserProduct]:
         '''
@@ -31,12 +34,10 @@ class OzonParser(BaseParser):
         '''
         try:
             search_url = f'{self.SEARCH_URL}?text={query}'
-            self.driver.get(search_url)
-
             #Ждем загрузки результатов
-            await asyncio.sleep(3)
+            page_source = await self._load_page(search_url, wait=3)
 
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
+            soup = BeautifulSoup(page_source, 'lxml')
 
             result = []
 
@@ -51,7 +52,7 @@ class OzonParser(BaseParser):
 
                     name = name_elem.text.strip()
                     price_str = price_elem.text.strip()
-                    url = f'{self.BASE_URL}{url_elem['href']}'
+                    url = f"{self.BASE_URL}{url_elem['href']}"
 
                     price = self.clean_price(price_str)
                     if not price:
@@ -82,10 +83,9 @@ class OzonParser(BaseParser):
             Optional[float]: Цена товара или None, если цена не найдена
         """
         try:
-            self.driver.get(url)
-            await asyncio.sleep(2)
+            page_source = await self._load_page(url, wait=2)
 
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
+            soup = BeautifulSoup(page_source, 'lxml')
             price_elem = soup.find('span', {'class': 'c3-a2'})
 
             if not price_elem:
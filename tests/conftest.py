@@ -0,0 +1,35 @@
+"""
+Общие фикстуры тестов.
+"""
+import time
+
+import pytest
+
+from app.health import StartupMetrics
+from config import Settings
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings(
+        _env_file=None,
+        BOT_TOKEN="42:TEST",
+        POSTGRES_DB="db",
+        POSTGRES_USER="user",
+        POSTGRES_PASSWORD="password",
+        POSTGRES_HOST="localhost",
+        POSTGRES_PORT=5432,
+        REDIS_HOST="localhost",
+        REDIS_PORT=6379,
+        REDIS_DB=0,
+        REDIS_PASSWORD="password",
+        CHROME_DRIVER_PATH="/usr/bin/chromedriver",
+        HEALTH_HOST="127.0.0.1",
+        HEALTH_PORT=0,
+        SHUTDOWN_TIMEOUT=1,
+    )
+
+
+@pytest.fixture
+def metrics() -> StartupMetrics:
+    return StartupMetrics(started_at=time.monotonic())
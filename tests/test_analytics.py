@@ -0,0 +1,240 @@
+"""
+Тесты агрегатов цен.
+"""
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from database.analytics import (
+    DAY, GRANULARITIES, HOUR, PriceAnalytics, PricePoint,
+    bucket_start, downsample, to_utc, update_price_rollups
+)
+from database.models import Base, PriceHistory, PriceRollup, Product, User
+
+MOSCOW = timezone(timedelta(hours=3))
+
+
+class RecordingSession:
+    """Сессия-заглушка, запоминающая выполненные запросы."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+    async def commit(self):
+        pass
+
+
+def compile_sql(statement):
+    return statement.compile(dialect=postgresql.dialect())
+
+
+def point(index: int, price: float, count: int = 1) -> PricePoint:
+    return PricePoint(
+        bucket_start=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=index),
+        min_price=price - 1,
+        max_price=price + 1,
+        avg_price=price,
+        last_price=price,
+        count=count
+    )
+
+
+def test_to_utc_treats_naive_time_as_utc():
+    assert to_utc(datetime(2024, 1, 1, 12)) == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert to_utc(datetime(2024, 1, 1, 2, tzinfo=MOSCOW)).tzinfo == timezone.utc
+
+
+def test_bucket_start():
+    moment = datetime(2024, 3, 5, 14, 37, 12, 500)
+
+    assert bucket_start(moment, HOUR) == datetime(2024, 3, 5, 14, tzinfo=timezone.utc)
+    assert bucket_start(moment, DAY) == datetime(2024, 3, 5, tzinfo=timezone.utc)
+    # 02:30 по Москве — это еще предыдущие сутки по UTC
+    assert bucket_start(datetime(2024, 3, 5, 2, 30, tzinfo=MOSCOW), DAY) == datetime(
+        2024, 3, 4, tzinfo=timezone.utc
+    )
+
+
+def test_bucket_start_rejects_unknown_granularity():
+    with pytest.raises(ValueError):
+        bucket_start(datetime(2024, 1, 1), "week")
+
+
+def test_downsample_returns_input_when_it_fits():
+    points = [point(i, 100 + i) for i in range(5)]
+
+    assert downsample(points, 5) is points
+    assert downsample(points, 0) is points
+    assert downsample(points, -1) is points
+
+
+def test_downsample_aggregates_groups():
+    prices = [10, 30, 20, 50, 40, 60, 70]
+    counts = [1, 3, 1, 1, 2, 2, 1]
+    points = [point(i, price, count) for i, (price, count) in enumerate(zip(prices, counts))]
+
+    result = downsample(points, 3)
+
+    assert len(result) == 3
+    # Группы: [0, 1], [2, 3], [4, 5, 6]
+    assert [p.bucket_start for p in result] == [
+        points[0].bucket_start, points[2].bucket_start, points[4].bucket_start
+    ]
+    assert [p.min_price for p in result] == [9, 19, 39]
+    assert [p.max_price for p in result] == [31, 51, 71]
+    assert [p.last_price for p in result] == [30, 50, 70]
+    assert [p.count for p in result] == [4, 2, 5]
+    assert [p.avg_price for p in result] == pytest.approx([
+        (10 + 30 * 3) / 4,
+        (20 + 50) / 2,
+        (40 * 2 + 60 * 2 + 70) / 5,
+    ])
+
+
+def test_downsample_never_exceeds_max_points():
+    points = [point(i, 100 + i % 7) for i in range(1000)]
+
+    for max_points in (1, 7, 200, 999):
+        result = downsample(points, max_points)
+        assert len(result) <= max_points
+        assert sum(p.count for p in result) == len(points)
+        assert result[-1].last_price == points[-1].last_price
+
+
+async def test_update_price_rollups_upserts_utc_buckets():
+    session = RecordingSession()
+    history = PriceHistory(
+        product_id=1,
+        price=999.0,
+        url="https://shop/item",
+        store="Ozon",
+        created_at=datetime(2024, 3, 5, 14, 37)
+    )
+
+    await update_price_rollups(session, history)
+
+    assert len(session.statements) == len(GRANULARITIES)
+    buckets = []
+    for statement in session.statements:
+        compiled = compile_sql(statement)
+        sql = str(compiled)
+        assert "ON CONFLICT ON CONSTRAINT uq_price_rollups_bucket DO UPDATE" in sql
+        assert "least(price_rollups.min_price, excluded.min_price)" in sql
+        assert "greatest(price_rollups.max_price, excluded.max_price)" in sql
+        assert "price_rollups.sum_price + excluded.sum_price" in sql
+        assert "price_rollups.count + excluded.count" in sql
+        assert compiled.params["last_at"] == datetime(2024, 3, 5, 14, 37, tzinfo=timezone.utc)
+        buckets.append((compiled.params["granularity"], compiled.params["bucket_start"]))
+
+    assert buckets == [
+        (HOUR, datetime(2024, 3, 5, 14, tzinfo=timezone.utc)),
+        (DAY, datetime(2024, 3, 5, tzinfo=timezone.utc)),
+    ]
+
+
+async def test_rebuild_rollups_truncates_in_utc():
+    session = RecordingSession()
+
+    await PriceAnalytics(session).rebuild_rollups(1)
+
+    inserts = [str(compile_sql(statement)) for statement in session.statements[1:]]
+    assert len(inserts) == len(GRANULARITIES)
+    truncated_in_utc = re.compile(
+        r"timezone\([^,]+, date_trunc\([^,]+, "
+        r"timezone\([^,]+, price_history\.created_at\)\)\)"
+    )
+    for sql in inserts:
+        assert truncated_in_utc.search(sql)
+
+
+def test_rollups_have_index_without_store():
+    indexes = {index.name: index for index in PriceRollup.__table__.indexes}
+    index = indexes["ix_price_rollups_product_granularity_bucket"]
+
+    assert [column.name for column in index.columns] == [
+        "product_id", "granularity", "bucket_start"
+    ]
+    assert "ix_price_rollups_product_granularity_bucket" in str(
+        CreateIndex(index).compile(dialect=postgresql.dialect())
+    )
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="нужна PostgreSQL база в TEST_DATABASE_URL"
+)
+async def test_incremental_and_rebuilt_rollups_agree():
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    # Часовой пояс сессии не UTC, чтобы проверить границы суток
+    engine = create_async_engine(
+        os.environ["TEST_DATABASE_URL"],
+        connect_args={"server_settings": {"timezone": "Europe/Moscow"}}
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    start = datetime(2024, 3, 4, 22, 10)
+    samples = [
+        (start + timedelta(minutes=25 * i), store, 100.0 + (i * 37) % 23)
+        for i in range(12)
+        for store in ("Ozon", "Wildberries")
+    ]
+
+    def rows(rollups):
+        return sorted(
+            (
+                r.store, r.granularity, to_utc(r.bucket_start), r.min_price,
+                r.max_price, round(r.sum_price, 6), r.count, r.last_price
+            )
+            for r in rollups
+        )
+
+    expected = {}
+    for created_at, store, price in samples:
+        for granularity in GRANULARITIES:
+            key = (store, granularity, bucket_start(created_at, granularity))
+            prices = expected.setdefault(key, [])
+            prices.append(price)
+    expected_rows = sorted(
+        (*key, min(prices), max(prices), round(sum(prices), 6), len(prices), prices[-1])
+        for key, prices in expected.items()
+    )
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            session.add(User(id=1))
+            session.add(Product(id=1, user_id=1, name="iPhone 15", target_price=1))
+            await session.flush()
+            for created_at, store, price in samples:
+                history = PriceHistory(
+                    product_id=1, price=price, url="https://shop/item",
+                    store=store, created_at=created_at
+                )
+                session.add(history)
+                await session.flush()
+                await update_price_rollups(session, history)
+            await session.commit()
+
+            incremental = rows((await session.execute(select(PriceRollup))).scalars())
+
+            await PriceAnalytics(session).rebuild_rollups(1)
+            session.expire_all()
+            rebuilt = rows((await session.execute(select(PriceRollup))).scalars())
+
+        assert incremental == expected_rows
+        assert rebuilt == expected_rows
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
@@ -0,0 +1,254 @@
+"""
+Тесты запуска и остановки приложения.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+from app.bootstrap import Application
+from app.resources import Resources
+from database.operations import DatabaseOperations
+from parsers.pool import BrowserPool
+
+
+class FakeSession:
+    """HTTP сессия бота-заглушки."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBot:
+    """Бот-заглушка, запоминающий отправленные сообщения."""
+
+    def __init__(self):
+        self.messages = []
+        self.session = FakeSession()
+
+    async def send_message(self, chat_id, text):
+        self.messages.append((chat_id, text))
+
+
+class FakeDispatcher:
+    """Диспетчер-заглушка, получающий обновления до вызова stop_polling."""
+
+    def __init__(self):
+        self._stopped = asyncio.Event()
+        self._polling = False
+
+    async def start_polling(self, *bots, **kwargs):
+        self._polling = True
+        await self._stopped.wait()
+        self._polling = False
+
+    async def stop_polling(self):
+        if not self._polling:
+            raise RuntimeError("Polling is not started")
+        self._stopped.set()
+
+    def resolve_used_update_types(self):
+        return []
+
+
+class FakeDriver:
+    """Драйвер-заглушка, запоминающий закрытие."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def quit(self):
+        self.events.append("driver quit")
+
+
+def make_application(settings, metrics) -> Application:
+    application = Application(settings, metrics)
+
+    def create_bot():
+        application.bot = FakeBot()
+        application.dispatcher = FakeDispatcher()
+
+    application._create_bot = create_bot
+    return application
+
+
+async def wait_until(condition, timeout: float = 1) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def readiness_status(application: Application) -> int:
+    port = application.health._runner.addresses[0][1]
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"http://127.0.0.1:{port}/readyz") as response:
+            return response.status
+
+
+async def test_readiness_follows_run_and_shutdown(settings, metrics):
+    application = make_application(settings, metrics)
+    stopping = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def monitor():
+        await application._stop_event.wait()
+        stopping.set()
+        await finish.wait()
+
+    application._run_monitor = monitor
+    assert not application.is_ready()
+
+    running = asyncio.create_task(application.run())
+    await wait_until(application.is_ready)
+    assert await readiness_status(application) == 200
+    assert metrics.as_dict()["ready_seconds"] is not None
+
+    application.request_shutdown()
+    await stopping.wait()
+    assert await readiness_status(application) == 503
+
+    finish.set()
+    await running
+    assert application.bot.session.closed
+    assert application.health._runner is None
+
+
+async def test_shutdown_drains_scrape_before_closing_pool(settings, metrics):
+    application = make_application(settings, metrics)
+    events = []
+    application.resources._browser_pool = BrowserPool(1, lambda: FakeDriver(events))
+    scraping = asyncio.Event()
+
+    async def monitor():
+        async with application.resources.browser_pool.acquire():
+            scraping.set()
+            await asyncio.sleep(0.1)
+            events.append("scrape done")
+        await application._stop_event.wait()
+
+    application._run_monitor = monitor
+    running = asyncio.create_task(application.run())
+    await scraping.wait()
+
+    application.request_shutdown()
+    await running
+
+    assert events == ["scrape done", "driver quit"]
+    assert application.resources.status()["browser_pool"] is False
+
+
+async def test_shutdown_timeout_is_shared(settings, metrics):
+    application = make_application(settings, metrics)
+    events = []
+    application.resources._browser_pool = BrowserPool(1, lambda: FakeDriver(events))
+    scraping = asyncio.Event()
+
+    async def hold_driver():
+        async with application.resources.browser_pool.acquire():
+            scraping.set()
+            await asyncio.sleep(3600)
+
+    # Проверка, которая не реагирует на остановку и не отдает драйвер
+    hold_driver_task = asyncio.create_task(hold_driver())
+
+    async def monitor():
+        await asyncio.shield(hold_driver_task)
+
+    application._run_monitor = monitor
+    running = asyncio.create_task(application.run())
+    await scraping.wait()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    application.request_shutdown()
+    await running
+    elapsed = loop.time() - started
+    hold_driver_task.cancel()
+
+    assert settings.SHUTDOWN_TIMEOUT <= elapsed < settings.SHUTDOWN_TIMEOUT * 1.5
+
+
+async def test_failed_startup_still_shuts_down(settings, metrics):
+    application = make_application(settings, metrics)
+
+    async def failing_start():
+        raise OSError("address already in use")
+
+    application.health.start = failing_start
+
+    try:
+        await application.run()
+    except OSError:
+        pass
+    else:
+        raise AssertionError("run() должен пробросить ошибку запуска")
+
+    assert application.bot.session.closed
+    assert not application.is_ready()
+
+
+async def test_resources_are_created_on_first_access(settings):
+    resources = Resources(settings)
+    assert resources.status() == {
+        "database": False,
+        "redis": False,
+        "browser_pool": False,
+    }
+
+    resources.redis
+    assert resources.status()["redis"]
+    assert not resources.status()["database"]
+
+    resources.session_factory
+    resources.browser_pool
+    assert all(resources.status().values())
+
+    await resources.close(1)
+    assert not any(resources.status().values())
+
+
+def found(price: float, store: str = 'Ozon') -> dict:
+    return {
+        'product_id': 1,
+        'name': 'iPhone 15',
+        'price': price,
+        'url': 'https://shop/iphone',
+        'store': store,
+        'target_price': 90000,
+    }
+
+
+async def test_price_notification_is_sent_once_per_price(settings, metrics, monkeypatch):
+    application = Application(settings, metrics)
+    application.bot = FakeBot()
+    saved = []
+
+    @asynccontextmanager
+    async def session_factory():
+        yield None
+
+    async def add_price_history(self, **kwargs):
+        saved.append(kwargs['price'])
+
+    monkeypatch.setattr(
+        type(application.resources), 'session_factory',
+        property(lambda self: session_factory)
+    )
+    monkeypatch.setattr(DatabaseOperations, 'add_price_history', add_price_history)
+    owners = {1: 100}
+
+    for price in (80000, 80000, 85000, 79000):
+        await application._on_price_found(found(price), owners)
+    await application._on_price_found(found(80000, store='Wildberries'), owners)
+
+    assert saved == [80000, 80000, 85000, 79000, 80000]
+    texts = [text for _, text in application.bot.messages]
+    assert len(texts) == 3
+    assert 'Ozon за 80000' in texts[0]
+    assert 'Ozon за 79000' in texts[1]
+    assert 'Wildberries за 80000' in texts[2]
@@ -0,0 +1,27 @@
+"""
+Тесты ленивой конфигурации.
+"""
+import importlib
+
+import pytest
+from pydantic import ValidationError
+
+
+def test_import_does_not_read_settings(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("BOT_TOKEN", raising=False)
+    config = importlib.reload(importlib.import_module("config"))
+
+    with pytest.raises(ValidationError):
+        config.get_config()
+
+
+def test_config_attribute_is_cached_settings(settings, monkeypatch):
+    config = importlib.reload(importlib.import_module("config"))
+    monkeypatch.setattr(config, "Settings", lambda: settings)
+
+    assert config.config is settings
+    assert config.get_config() is settings
+
+    with pytest.raises(AttributeError):
+        config.missing
@@ -0,0 +1,65 @@
+"""
+Тесты менеджера парсеров.
+"""
+from parsers.base import ParserProduct
+from parsers.manager import ParserManager
+
+
+def offer(name: str, price: float, store: str = 'Ozon') -> ParserProduct:
+    return ParserProduct(name=name, price=price, url=f'https://shop/{price}', store=store)
+
+
+async def test_monitor_once_reports_best_matching_offer_per_store():
+    manager = ParserManager()
+    results = {
+        'iPhone 15': [
+            offer('Чехол для iPhone', 500),
+            offer('Apple iPhone 15 128GB', 70000),
+            offer('Apple iPhone 15 256GB', 80000),
+            offer('iPhone 15', 75000, store='Wildberries'),
+        ],
+    }
+
+    async def search_all_stores(query):
+        return results[query]
+
+    manager.search_all_stores = search_all_stores
+    found = []
+
+    async def callback(data):
+        found.append(data)
+
+    await manager.monitor_once(
+        [{'id': 1, 'name': 'iPhone 15', 'target_price': 90000}],
+        callback
+    )
+
+    assert sorted((item['store'], item['price']) for item in found) == [
+        ('Ozon', 70000),
+        ('Wildberries', 75000),
+    ]
+
+
+async def test_monitor_once_continues_after_callback_error():
+    manager = ParserManager()
+
+    async def search_all_stores(query):
+        return [offer(query, 100)]
+
+    manager.search_all_stores = search_all_stores
+    handled = []
+
+    async def callback(data):
+        if data['product_id'] == 1:
+            raise RuntimeError('bot was blocked by the user')
+        handled.append(data['product_id'])
+
+    await manager.monitor_once(
+        [
+            {'id': 1, 'name': 'first', 'target_price': 200},
+            {'id': 2, 'name': 'second', 'target_price': 200},
+        ],
+        callback
+    )
+
+    assert handled == [2]
@@ -0,0 +1,63 @@
+"""
+Тесты парсеров.
+"""
+import asyncio
+import time
+
+from parsers.pool import BrowserPool
+from parsers.sites.ozon import OzonParser
+
+
+class SlowDriver:
+    """Драйвер-заглушка с блокирующей загрузкой страницы."""
+
+    page_source = '<span class="c3-a2">1 299 ₽</span>'
+
+    def get(self, url):
+        time.sleep(0.2)
+
+    def quit(self):
+        pass
+
+
+async def test_page_loads_do_not_block_event_loop():
+    pool = BrowserPool(2, SlowDriver)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def load_page():
+        async with pool.acquire() as driver:
+            async with OzonParser(driver) as parser:
+                return await parser._load_page('https://www.ozon.ru/product/1')
+
+    ticking = asyncio.create_task(ticker())
+    started = time.monotonic()
+    pages = await asyncio.gather(load_page(), load_page())
+    elapsed = time.monotonic() - started
+    ticking.cancel()
+
+    assert pages == [SlowDriver.page_source] * 2
+    assert elapsed < 0.35
+    assert ticks > 5
+    await pool.close(1)
+
+
+async def test_ozon_product_price_is_parsed_from_loaded_page(monkeypatch):
+    loaded = []
+
+    async def load_page(self, url, wait=0):
+        loaded.append((url, wait))
+        return SlowDriver.page_source
+
+    monkeypatch.setattr(OzonParser, '_load_page', load_page)
+
+    async with OzonParser(SlowDriver()) as parser:
+        price = await parser.get_product_price('https://www.ozon.ru/product/1')
+
+    assert price == 1299.0
+    assert loaded == [('https://www.ozon.ru/product/1', 2)]
@@ -0,0 +1,120 @@
+"""
+Тесты пула браузеров.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from parsers.pool import BrowserPool
+
+
+class FakeDriver:
+    """Драйвер-заглушка, запоминающий закрытие."""
+
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+class FakeFactory:
+    """Фабрика драйверов, которую можно задержать на время создания."""
+
+    def __init__(self):
+        self.drivers = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self):
+        self.release.wait(5)
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return driver
+
+
+async def test_drivers_are_created_lazily_and_reused():
+    factory = FakeFactory()
+    pool = BrowserPool(2, factory)
+    assert pool.created == 0
+
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert pool.created == 1
+    assert await pool.close(1)
+    assert first.closed
+
+
+async def test_broken_driver_is_not_returned():
+    factory = FakeFactory()
+    pool = BrowserPool(1, factory)
+
+    with pytest.raises(ValueError):
+        async with pool.acquire():
+            raise ValueError("scrape failed")
+
+    assert factory.drivers[0].closed
+    assert pool.created == 0
+
+
+async def test_close_waits_for_driver_being_created():
+    factory = FakeFactory()
+    factory.release.clear()
+    pool = BrowserPool(1, factory)
+    scraped = False
+
+    async def scrape():
+        nonlocal scraped
+        async with pool.acquire():
+            scraped = True
+
+    task = asyncio.create_task(scrape())
+    await asyncio.sleep(0.05)
+    assert pool.in_use == 1
+
+    close = asyncio.create_task(pool.close(1))
+    await asyncio.sleep(0.05)
+    assert not close.done()
+
+    factory.release.set()
+    assert await close
+    with pytest.raises(RuntimeError):
+        await task
+    assert not scraped
+    assert factory.drivers[0].closed
+
+
+async def test_waiters_do_not_start_drivers_after_close():
+    factory = FakeFactory()
+    pool = BrowserPool(1, factory)
+    holding = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold():
+        async with pool.acquire():
+            holding.set()
+            await release.wait()
+
+    async def wait_for_driver():
+        async with pool.acquire():
+            pass
+
+    holder = asyncio.create_task(hold())
+    await holding.wait()
+    waiter = asyncio.create_task(wait_for_driver())
+    await asyncio.sleep(0)
+
+    close = asyncio.create_task(pool.close(1))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await close
+    await holder
+    with pytest.raises(RuntimeError):
+        await waiter
+    assert len(factory.drivers) == 1
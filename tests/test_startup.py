@@ -0,0 +1,27 @@
+"""
+Тесты запуска процесса бота.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_startup_benchmark():
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "benchmarks" / "startup.py")],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        cwd=ROOT
+    )
+    assert result.returncode == 0, result.stderr
+
+    metrics = json.loads(result.stdout.strip().splitlines()[-1])
+    print(f"Метрики запуска: {metrics}")
+
+    assert metrics["heavy_modules_after_import"] == []
+    assert metrics["heavy_modules_at_first_update"] == []
+    assert 0 < metrics["ready_seconds"] <= metrics["first_update_seconds"]
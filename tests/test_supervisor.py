@@ -0,0 +1,73 @@
+"""
+Тесты супервизора фоновых задач.
+"""
+import asyncio
+
+from app.supervisor import Supervisor
+
+
+async def test_failed_service_is_restarted():
+    supervisor = Supervisor()
+    supervisor.MAX_BACKOFF = 0
+    calls = 0
+    done = asyncio.Event()
+
+    async def service():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        done.set()
+
+    supervisor.add("service", service)
+    supervisor.start()
+    await asyncio.wait_for(done.wait(), 1)
+    await supervisor.stop(1)
+
+    assert calls == 2
+    assert supervisor.services["service"].restarts == 1
+
+
+async def test_stop_interrupts_backoff_without_restart():
+    supervisor = Supervisor()
+    calls = 0
+    failed = asyncio.Event()
+
+    async def service():
+        nonlocal calls
+        calls += 1
+        failed.set()
+        raise RuntimeError("boom")
+
+    supervisor.add("service", service)
+    supervisor.start()
+    await asyncio.wait_for(failed.wait(), 1)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await supervisor.stop(5)
+
+    assert loop.time() - started < 1
+    assert calls == 1
+    assert supervisor.status() == {"service": False}
+
+
+async def test_stop_cancels_services_after_timeout():
+    supervisor = Supervisor()
+    cancelled = asyncio.Event()
+
+    async def service():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    supervisor.add("service", service)
+    supervisor.start()
+    await asyncio.sleep(0)
+    assert supervisor.status() == {"service": True}
+
+    await supervisor.stop(0.05)
+
+    assert cancelled.is_set()